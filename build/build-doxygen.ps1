@@ -98,12 +98,25 @@ else {
 }
 
 # A function to remove empty directories, recursively.
+# Each directory is enumerated only once. Return $true if it was actually removed
+# (the removal may fail, for instance when another process has a handle on it).
 function Remove-EmptyFolder($path)
 {
-    Get-ChildItem $path -Directory | ForEach-Object { Remove-EmptyFolder $_.FullName }
-    if (@(Get-ChildItem $path).Count -eq 0) {
-        Remove-Item $path -Force
+    $Empty = $true
+    foreach ($Item in @(Get-ChildItem $path)) {
+        if (-not $Item.PSIsContainer -or -not (Remove-EmptyFolder $Item.FullName)) {
+            $Empty = $false
+        }
+    }
+    if ($Empty) {
+        try {
+            Remove-Item $path -Force -ErrorAction Stop
+        }
+        catch {
+            $Empty = $false
+        }
     }
+    return $Empty
 }
 
 # Generate Doxygen documentation.
@@ -129,7 +142,7 @@ if ($DoxyExe) {
     Pop-Location
 
     # Delete empty subdirectories (many of them created for nothing in case of hierachical output).
-    Remove-EmptyFolder $DoxyDir
+    [void](Remove-EmptyFolder $DoxyDir)
 
     # Open the browser.
     if (-not $NoOpen) {
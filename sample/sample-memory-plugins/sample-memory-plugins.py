@@ -61,9 +61,11 @@ class OutputHandler(tsduck.AbstractPluginEventHandler):
     def handlePluginEvent(self, context, data):
         packets_count = len(data) // tsduck.PKT_SIZE
         self._report.info("received %d output packets" % (packets_count))
+        # Convert the complete buffer in hexadecimal once, then display one packet per line.
+        hexdata = data[:packets_count * tsduck.PKT_SIZE].hex()
+        width = 2 * tsduck.PKT_SIZE
         for i in range(packets_count):
-            packet = data[i * tsduck.PKT_SIZE : tsduck.PKT_SIZE]
-            self._report.info("packet #%d: %s" % (i, packet.hex()))
+            self._report.info("packet #%d: %s" % (i, hexdata[i * width : (i + 1) * width]))
 
 
 #----------------------------------------------------------------------------